@@ -1,19 +1,50 @@
 import requests
+from dataclasses import dataclass
 from datetime import datetime
+import numpy as np
 import pandas as pd
 import uuid
-import pandasql as ps
+import os
+import gzip
+from pathlib import Path
+
+# Use orjson for decoding the API response when it is installed
+try:
+    import orjson as json_parser
+except ImportError:
+    import json as json_parser
 import logging
 
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Columns of the members and mentorship dataframes
+MEMBER_COLUMNS = ["UUID", "Fullname", "Email", "Age", "gender", "ID", "registered_date", "Address",
+                  "is_mentor_eligible", "is_mentoree_eligible"]
+MENTORSHIP_COLUMNS = ["UUID", "Mentor_uuid", "Mentoree_uuid"]
+
+# API fields read by member_records; the API is asked to return only these
+API_FIELDS = ["login", "name", "email", "dob", "gender", "id", "registered", "location"]
+
+# Directory where API responses are cached between runs
+CACHE_DIR = Path(".cache")
+
+# Shared HTTP session so repeated API calls reuse the same pooled keep-alive connection
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+# Seconds to wait for the API before giving up
+REQUEST_TIMEOUT = 10
+
 
 def fetch_users(n=500, nationality="ca", seed="vendease"):
     """
     Fetches data from the Random User Generator API.
 
+    The seeded API response is deterministic, so it is cached on disk as gzip-compressed JSON
+    and reused on later runs instead of calling the API again.
+
     Parameters:
     - n (int): The number of users to fetch (default is 500 as instructed).
     - nationality (str): The nationality of the users to fetch (default is "ca" for Canada).
@@ -26,21 +57,42 @@ def fetch_users(n=500, nationality="ca", seed="vendease"):
     - Exception: If the API request fails, an exception is raised.
     """
 
-    url = f"https://randomuser.me/api/?page=1&results={n}&nat={nationality}&seed={seed}"
+    cache_path = CACHE_DIR / f"randomuser_{seed}_{nationality}_{n}.json.gz"
+
+    # Reuse the cached response when there is one
+    if cache_path.exists():
+        try:
+            members = json_parser.loads(gzip.decompress(cache_path.read_bytes()))["results"]
+            logging.info(f"Loaded {len(members)} users from cache '{cache_path}'.")
+            return members
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Ignoring unreadable cache '{cache_path}': {e}")
+
+    url = f"https://randomuser.me/api/?page=1&results={n}&nat={nationality}&seed={seed}&inc={','.join(API_FIELDS)}"
     
     logging.info(f"Fetching {n} users from API with nationality '{nationality}' and seed '{seed}'...")
 
     try:
-        response = requests.get(url)
+        response = HTTP_SESSION.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()  # Raise an error for non-200 responses
-        members = response.json()["results"]
+        members = json_parser.loads(response.content)["results"]
         logging.info(f"Successfully fetched {len(members)} users.")
-        return members
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         logging.error(f"Failed to fetch users: {e}")
         raise Exception("Failed to fetch users") from e
+
+    # Cache the raw response for later runs
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(gzip.compress(response.content))
+        logging.info(f"Cached API response to '{cache_path}'.")
+    except OSError as e:
+        logging.warning(f"Failed to cache API response: {e}")
+
+    return members
     
 
+@dataclass(slots=True)
 class Member:
     """
     Creates a Member Class with personal details, registration date, and address.
@@ -49,179 +101,180 @@ class Member:
     - uuid (str): Unique identifier for the member.
     - fullname (str): Full name of the member comprising of first and last name.
     - email (str): Email address of the member.
-    - age (float): Age of the member.
+    - age (int): Age of the member.
     - gender (str): Gender of the member.
     - id (str): ID value assigned to the member.
-    - registered_date (datetime): The date and time the member registered which is parsed into a datetime object.
+    - registered_date (datetime): The date and time the member registered.
     - address (str): The full address of the member containing "street, postcode and city".
+    """
 
+    uuid: str
+    fullname: str
+    email: str
+    age: int
+    gender: str
+    id: str
+    registered_date: datetime
+    address: str
 
-    Returns:
-        string: The member's details.
-    """
 
-    def __init__(self, uuid, first_name, last_name, email, age, gender, id_value, registered_date, street, postcode, city):
-        self.uuid = uuid
-        self.fullname = f"{first_name} {last_name}"
-        self.email = email
-        self.age = age
-        self.gender = gender
-        self.id = id_value
-        self.registered_date = datetime.strptime(registered_date, "%Y-%m-%dT%H:%M:%S.%fZ")
-        self.address = f"{street}, {postcode} {city}"
-
-    def __str__(self):
-        return (f"UUID: {self.uuid}\n"
-                f"Fullname: {self.fullname}\n"
-                f"Email: {self.email}\n"
-                f"Age: {self.age}\n"
-                f"Gender: {self.gender}\n"
-                f"ID: {self.id}\n"
-                f"Registered Date: {self.registered_date}\n"
-                f"Address: {self.address}")
-    
+# Raw API fields extracted for every member, in the order yielded by member_records
+MEMBER_RECORD_FIELDS = ["uuid", "first_name", "last_name", "email", "age", "gender", "id_value",
+                        "registered_date", "street_number", "street_name", "postcode", "city"]
 
-def create_members(members):
+
+def member_records(members):
     """
-    Using the Member Class, the API query results are converted into a structured list of member dictionaries.
+    Yields the fields needed to create a member from each API record, one record at a time.
+
+    Records with missing keys are logged and skipped.
 
     Parameters:
     - members (list of dicts): containing user data dictionaries fetched from the API.
 
-    Returns:
-    - list of dicts: where each dictionary represents a member with their associated details.
+    Yields:
+    - tuple: the raw member fields in the order of MEMBER_RECORD_FIELDS.
     """
 
-    logging.info("Starting member creation process...")
-
-    member_data = []  
-
-    for index, user_data in enumerate(members):
+    for user_data in members:
         try:
-            # Create the Member object using the user data
-            member = Member(
-                uuid=user_data["login"]["uuid"],  
-                first_name=user_data["name"]["first"],  
-                last_name=user_data["name"]["last"],  
-                email=user_data["email"],  
-                age=user_data["dob"]["age"],  
-                gender=user_data["gender"],  
-                id_value=user_data["id"]["value"],  
-                registered_date=user_data["registered"]["date"],  
-                street=f"{user_data['location']['street']['number']} {user_data['location']['street']['name']}", 
-                postcode=user_data["location"]["postcode"], 
-                city=user_data["location"]["city"]  
+            location = user_data["location"]
+            yield (
+                user_data["login"]["uuid"],
+                user_data["name"]["first"],
+                user_data["name"]["last"],
+                user_data["email"],
+                user_data["dob"]["age"],
+                user_data["gender"],
+                user_data["id"]["value"],
+                user_data["registered"]["date"],
+                location["street"]["number"],
+                location["street"]["name"],
+                location["postcode"],
+                location["city"]
             )
-
-            # Append the processed member data as a dictionary to the defined list
-            member_data.append({
-                "UUID": member.uuid,  
-                "Fullname": member.fullname,  
-                "Email": member.email,  
-                "Age": member.age,  
-                "gender": member.gender,  
-                "ID": member.id,  
-                "registered_date": member.registered_date,  
-                "Address": member.address  
-            })
-
-            if (index + 1) % 100 == 0:  # Log progress for every 100 members
-                logging.info(f"Processed {index + 1} members...")
-
         except KeyError as e:
             logging.error(f"Missing key {e} in user data: {user_data}")
-        except Exception as e:
-            logging.error(f"Error processing user data: {e}")
-
-    logging.info(f"Member creation completed. Total members processed: {len(member_data)}")
-    
-    return member_data
 
 
-def filter_mentors_and_mentorees(member_data):
+def create_members(members):
     """
-    Filters the mentors and mentorees from the member_data processed from the Member Class
+    Converts the API query results into a members dataframe whose columns match the Member Class properties.
 
     Parameters:
-    - member_data (list of dict): Contains the members processed using the Member Class
+    - members (list of dicts): containing user data dictionaries fetched from the API.
 
     Returns:
-    - mentors: A list containing the mentors and their details
-    - mentorees: A list containing the mentorees and their details
+    - member_df: Pandas dataframe where each row represents a member with their associated details, ordered by registered date.
     """
 
-    logging.info("Starting filtering process for mentors and mentorees...")
+    logging.info("Starting member creation process...")
 
-    # Define the empty lists for both mentors and mentorees
-    mentors = []
-    mentorees = []
+    if not members:
+        logging.warning("No user data available for member creation.")
+        return pd.DataFrame(columns=MEMBER_COLUMNS)
+
+    # Stream only the needed fields into a single dataframe instead of flattening every nested API field
+    df = pd.DataFrame.from_records(member_records(members), columns=MEMBER_RECORD_FIELDS, nrows=len(members))
+
+    if df.empty:
+        logging.warning("No valid user data available for member creation.")
+        return pd.DataFrame(columns=MEMBER_COLUMNS)
+
+    # Build the member columns with vectorized operations instead of one Member object per row
+    # Ages fit in int8 and registered dates only carry whole seconds, so the narrower dtypes lose nothing
+    # Registered dates are parsed by the ISO 8601 parser and kept as naive UTC timestamps
+    member_df = pd.DataFrame({
+        "UUID": df["uuid"],
+        "Fullname": df["first_name"].str.cat(df["last_name"], sep=" "),
+        "Email": df["email"],
+        "Age": df["age"].astype("int8"),
+        "gender": df["gender"].astype("category"),
+        "ID": df["id_value"],
+        "registered_date": pd.to_datetime(df["registered_date"], format="ISO8601", cache=True)
+                             .dt.tz_convert(None)
+                             .astype("datetime64[s]"),
+        "Address": df["street_number"].astype(str) + " " + df["street_name"] + ", "
+                   + df["postcode"].astype(str) + " " + df["city"]
+    })
+
+    # Order the members by registered date once, so the mentors and mentorees filtered from them are already sorted
+    member_df = member_df.sort_values("registered_date", kind="stable", ignore_index=True)
+
+    # Evaluate the mentor and mentoree criteria once so later steps only read these columns
+    # Mentor criteria: Female, at least 40 years old, joined on or before 2004-01-01
+    member_df["is_mentor_eligible"] = (member_df["gender"].eq("female") &
+                                       member_df["Age"].ge(40) &
+                                       member_df["registered_date"].le(pd.Timestamp("2004-01-01")))
+
+    # mentoree criteria: Any gender, 30 years old or younger
+    member_df["is_mentoree_eligible"] = member_df["Age"].le(30)
+
+    logging.info(f"Member creation completed. Total members processed: {len(member_df)}")
+    
+    return member_df
 
-    for index, user in enumerate(member_data):
-        try:
-            # Define the member's age
-            age = user["Age"]
 
-            # Mentor criteria: Female, at least 40 years old, joined on or before 2004-01-01
-            if user["gender"] == "female" and age >= 40 and user["registered_date"] <= datetime(2004, 1, 1):
-                mentors.append(user)
+def filter_mentors_and_mentorees(member_df):
+    """
+    Filters the mentors and mentorees from the members dataframe
 
-            # mentoree criteria: Any gender, 30 years old or younger
-            if age <= 30:
-                mentorees.append(user)
+    Parameters:
+    - member_df: Pandas dataframe containing the members data
 
-            # Log progress every 100 members processed
-            if (index + 1) % 100 == 0:
-                logging.info(f"Processed {index + 1} members...")
+    Returns:
+    - mentors: Pandas dataframe containing the mentors and their details
+    - mentorees: Pandas dataframe containing the mentorees and their details
+    """
 
-        except KeyError as e:
-            logging.error(f"Missing key {e} in user data: {user}")
-        except Exception as e:
-            logging.error(f"Error processing user data: {e}")
+    logging.info("Starting filtering process for mentors and mentorees...")
+
+    try:
+        # Convert the eligibility masks to row positions once and take the rows by position
+        mentor_rows = np.flatnonzero(member_df["is_mentor_eligible"].to_numpy(dtype=bool))
+        mentoree_rows = np.flatnonzero(member_df["is_mentoree_eligible"].to_numpy(dtype=bool))
+    except KeyError as e:
+        logging.error(f"Missing key {e} in member data.")
+        raise
+
+    # Reset the index so the filtered frames keep a compact RangeIndex
+    mentors = member_df.iloc[mentor_rows].reset_index(drop=True)
+    mentorees = member_df.iloc[mentoree_rows].reset_index(drop=True)
 
     logging.info(f"Filtering completed: {len(mentors)} mentors, {len(mentorees)} mentorees identified.")
     
     return mentors, mentorees
 
 
+@dataclass(slots=True)
 class Mentorships:
     """
     Creates the Mentorship Class that will assign mentors to their registered mentorees
 
     Attributes:
-    - uuid (str): Unique identifier for the member.
+    - uuid (str): Unique identifier for the mentorship.
     - mentor_uuid (str): Unique identifier for the Mentor
     - mentoree_uuid (str): Unique identifier for the mentoree
-
-    Returns:
-        string: The mentors and mentorees mentorship mapping.
     """
-    def __init__(self, uuid, mentor_uuid, mentoree_uuid):
-        self.uuid = uuid
-        self.mentor_uuid = mentor_uuid
-        self.mentoree_uuid = mentoree_uuid
 
-    def __str__(self):
-        return (f"UUID: {self.uuid}\n"
-                f"Mentor_uuid: {self.mentor_uuid}\n"
-                f"Mentoree_uuid: {self.mentoree_uuid}\n"
-                )
+    uuid: str
+    mentor_uuid: str
+    mentoree_uuid: str
 
 
 def create_mentorships(mentors, mentorees):
     """
-    Using the Mentorship Class, this creates an object containing mentors and their assigned mentorees.
+    Following the Mentorship Class properties, this creates a dataframe containing mentors and their assigned mentorees.
 
     Parameters:
-    - mentors (list of dicts): containing mentors and their details.
-    - mentorees (list of dicts): containing mentorees and their details.
+    - mentors: Pandas dataframe containing the assigned mentor for each mentoree.
+    - mentorees: Pandas dataframe containing mentorees and their details, paired row by row with the mentors.
 
     Returns:
-    - list of dicts: where each dictionary the mapping of mentorees to mentors.
+    - mentorship_df: Pandas dataframe where each row is the mapping of a mentoree to a mentor.
     """
 
-    logging.info("Starting mentorship assignment process...")
-
-    mentorship_data = []
+    logging.info("Starting mentorship creation process...")
 
     # find the number of mentors and mentorees
     num_mentors = len(mentors)
@@ -229,38 +282,30 @@ def create_mentorships(mentors, mentorees):
 
     if num_mentors == 0 or num_mentorees == 0:
         logging.warning("Mentorship process cannot proceed: Either no mentors or no mentorees available.")
-        return []
+        return pd.DataFrame(columns=MENTORSHIP_COLUMNS)
 
-    logging.info(f"Total mentors: {num_mentors}, Total mentorees: {num_mentorees}")
+    if num_mentors != num_mentorees:
+        logging.error(f"Mentors and mentorees must be paired row by row: {num_mentors} mentors, {num_mentorees} mentorees.")
+        raise ValueError("Mentors and mentorees must have the same length")
 
-    for index, (mentor, mentoree) in enumerate(zip(mentors, mentorees)):
-        try:
-            # Create a Mentorship object
-            mentorship = Mentorships(
-                uuid=str(uuid.uuid4()),
-                mentor_uuid=mentor["UUID"],
-                mentoree_uuid=mentoree["UUID"]
-            )
-
-            # Append mentorship data to the list
-            mentorship_data.append({
-                "UUID": mentorship.uuid,
-                "Mentor_uuid": mentorship.mentor_uuid,
-                "Mentoree_uuid": mentorship.mentoree_uuid
-            })
-
-            # Log progress every 50 assignments
-            if (index + 1) % 50 == 0:
-                logging.info(f"Assigned {index + 1} mentorship pairs...")
-
-        except KeyError as e:
-            logging.error(f"Missing key {e} in mentor or mentoree data: {mentor} | {mentoree}")
-        except Exception as e:
-            logging.error(f"Error creating mentorship: {e}")
+    # Draw the random bytes for every mentorship UUID in one call instead of one uuid4() call per pair
+    random_bytes = os.urandom(16 * num_mentorees)
+    mentorship_uuids = [str(uuid.UUID(bytes=random_bytes[i:i + 16], version=4))
+                        for i in range(0, len(random_bytes), 16)]
 
-    logging.info(f"Mentorship assignment completed: {len(mentorship_data)} pairs created.")
+    try:
+        mentorship_df = pd.DataFrame({
+            "UUID": mentorship_uuids,
+            "Mentor_uuid": mentors["UUID"].to_numpy(),
+            "Mentoree_uuid": mentorees["UUID"].to_numpy()
+        })
+    except KeyError as e:
+        logging.error(f"Missing key {e} in mentor or mentoree data.")
+        raise
+
+    logging.info(f"Mentorship creation completed: {len(mentorship_df)} pairs created.")
     
-    return mentorship_data
+    return mentorship_df
 
 
 def assign_mentorships(mentors, mentorees):
@@ -268,66 +313,53 @@ def assign_mentorships(mentors, mentorees):
     Assign mentorees to the Mentors using the Round-Robin Allocation Method.
 
     Parameters:
-    - mentors (list of dicts): containing mentors and their details.
-    - mentorees (list of dicts): containing mentorees and their details.
+    - mentors: Pandas dataframe containing mentors and their details.
+    - mentorees: Pandas dataframe containing mentorees and their details.
 
     Returns:
-    - list of dicts: where each dictionary the mapping of mentorees to mentors.
+    - mentorship_df: Pandas dataframe where each row is the mapping of a mentoree to a mentor.
     """
 
     logging.info("Starting mentorship assignment process using Round-Robin allocation...")
 
     # Checks if there are mentors and mentorees available
-    if not mentors:
+    if mentors.empty:
         logging.warning("No mentors available for assignment.")
-        return []
-    if not mentorees:
+        return pd.DataFrame(columns=MENTORSHIP_COLUMNS)
+    if mentorees.empty:
         logging.warning("No mentorees available for assignment.")
-        return []
+        return pd.DataFrame(columns=MENTORSHIP_COLUMNS)
 
-    # Sort mentors and mentorees by their registered date
-    mentors.sort(key=lambda m: m["registered_date"])
-    mentorees.sort(key=lambda m: m["registered_date"])
+    # Sort mentors and mentorees by their registered date (skipped when they come already sorted from create_members)
+    if not mentors["registered_date"].is_monotonic_increasing:
+        mentors = mentors.sort_values("registered_date", kind="stable", ignore_index=True)
+    if not mentorees["registered_date"].is_monotonic_increasing:
+        mentorees = mentorees.sort_values("registered_date", kind="stable", ignore_index=True)
 
-    mentorships = []
     mentor_count = len(mentors)
 
     logging.info(f"Total mentors: {mentor_count}, Total mentorees: {len(mentorees)}")
 
-    for index, mentoree in enumerate(mentorees):
-        try:
-            assigned_mentor = mentors[index % mentor_count]  # Round-robin allocation
-            
-            # Log each assignment
-            logging.info(f"Assigning {mentoree['Fullname']} to mentor {assigned_mentor['Fullname']}.")
+    # Round-robin allocation: the n-th mentoree goes to mentor n modulo the number of mentors
+    mentor_index = np.arange(len(mentorees)) % mentor_count
+    assigned_mentors = mentors.iloc[mentor_index]
 
-            # Call create_mentorships function to generate the mentorship relationship
-            mentorship = create_mentorships([assigned_mentor], [mentoree]) # pass them as list to aid processing
-            
-            # Extend mentorships list with the newly created pairs
-            mentorships.extend(mentorship)
+    # Generate the mentorship relationships for all pairs at once
+    mentorship_df = create_mentorships(assigned_mentors, mentorees)
 
-            # Log progress every 50 assignments
-            if (index + 1) % 50 == 0:
-                logging.info(f"{index + 1} mentorees assigned...")
+    logging.info(f"Mentorship assignment completed: {len(mentorship_df)} pairs created.")
 
-        except KeyError as e:
-            logging.error(f"Missing key {e} in mentor or mentoree data: {assigned_mentor} | {mentoree}")
-        except Exception as e:
-            logging.error(f"Error during mentorship assignment: {e}")
+    return mentorship_df
 
-    logging.info(f"Mentorship assignment completed: {len(mentorships)} pairs created.")
 
-    return mentorships
-
-
-def normalize_data(member_data, mentorships):
+def normalize_data(member_df, mentorship_df):
     """
-    This turns the list of dictionaries to pandas dataframe
+    Returns the members and mentorship dataframes. Both are already built as pandas dataframes upstream,
+    so this only validates them.
 
     Parameters:
-    - member_data (list of dicts): Contains the objects generated by the Member Class from the API results.
-    - mentorships (list of dicts): Contains the objects generated by the Mentorships Class from the mentor-mentoree mapping results.
+    - member_df: Pandas dataframe containing the members data.
+    - mentorship_df: Pandas dataframe containing the mentor-mentoree mapping results.
 
     Returns:
     - member_df: Pandas dataframe containing the members data
@@ -337,20 +369,13 @@ def normalize_data(member_data, mentorships):
     logging.info("Starting the data normalization process...")
 
     # Check if there is any member data or mentorship data
-    if not member_data:
+    if member_df.empty:
         logging.warning("No member data available for normalization.")
-    if not mentorships:
+    if mentorship_df.empty:
         logging.warning("No mentorship data available for normalization.")
 
-    # Normalize the members data from json to dataframe
-    logging.info("Normalizing member data...")
-    member_df = pd.json_normalize(member_data)
-    logging.info(f"Member data normalized. Shape of member dataframe: {member_df.shape}")
-
-    # Normalize the mentorship data from json to dataframe
-    logging.info("Normalizing mentorship data...")
-    mentorship_df = pd.json_normalize(mentorships)
-    logging.info(f"Mentorship data normalized. Shape of mentorship dataframe: {mentorship_df.shape}")
+    logging.info(f"Shape of member dataframe: {member_df.shape}")
+    logging.info(f"Shape of mentorship dataframe: {mentorship_df.shape}")
 
     logging.info("Data normalization completed.")
 
@@ -371,14 +396,12 @@ def median_age_of_male_mentorees(member_df, mentorship_df):
 
     logging.info("Starting the process to calculate the median age of male mentorees...")
 
-    # Merge the dataframes to get the relevant data for mentorees
-    logging.info("Merging the member and mentorship dataframes...")
-    mentorees_df = pd.merge(member_df, mentorship_df, left_on='UUID', right_on='Mentoree_uuid', how='inner')
-    logging.info(f"Merged dataframe shape: {mentorees_df.shape}")
-
-    # Filter for male mentorees who registered after 2010-01-01
+    # Every column needed lives in member_df, so mentorees are matched by UUID instead of merging both dataframes
     logging.info("Filtering male mentorees who registered on or after 2010-01-01...")
-    filtered_mentorees = mentorees_df[(mentorees_df['gender'] == 'male') & (mentorees_df['registered_date'] >= '2010-01-01')]
+    is_filtered_mentoree = (member_df['UUID'].isin(mentorship_df['Mentoree_uuid']) &
+                            member_df['gender'].eq('male') &
+                            member_df['registered_date'].ge(pd.Timestamp('2010-01-01')))
+    filtered_mentorees = member_df.loc[is_filtered_mentoree, ['Age']]
 
     # Log if no mentorees match the criteria
     if filtered_mentorees.empty:
@@ -410,28 +433,23 @@ def total_mentorees_by_gender_and_mentor_age(mentorship_df, member_df):
 
     logging.info("Starting the process to count mentorees by gender and mentor age...")
 
-    # SQL query to count mentorees by gender who are mentored by mentors at least 60 years old.
-    query = """
-    SELECT gender, COUNT(DISTINCT Mentoree_uuid) AS gender_count
-    FROM mentorship_df
-    JOIN member_df ON mentorship_df.Mentoree_uuid = member_df.UUID
-    WHERE mentor_uuid IN (
-    SELECT DISTINCT mentor_uuid
-    FROM mentorship_df
-    JOIN member_df ON mentorship_df.mentor_uuid = member_df.UUID
-    WHERE member_df.Age >= 60)
-    GROUP BY gender;
-    """
-
-    logging.info("Executing SQL query to count mentorees by gender for mentors at least 60 years old...")
+    # Find the mentors that are at least 60 years old
+    logging.info("Filtering mentorships with mentors at least 60 years old...")
+    older_mentor_uuids = member_df.loc[member_df['Age'] >= 60, 'UUID']
+    older_mentorships = mentorship_df[mentorship_df['Mentor_uuid'].isin(older_mentor_uuids)]
 
-    # Execute the query on the merged DataFrame
-    result = ps.sqldf(query, locals())
+    # Count distinct mentorees by their gender
+    logging.info("Counting mentorees by gender for mentors at least 60 years old...")
+    result = older_mentorships \
+        .merge(member_df[['UUID', 'gender']], left_on='Mentoree_uuid', right_on='UUID', how='inner') \
+        .groupby('gender', observed=True)['Mentoree_uuid'] \
+        .nunique() \
+        .reset_index(name='gender_count')
 
-    logging.info("Query executed successfully.")
+    logging.info("Count completed successfully.")
 
-    # Log the result
-    logging.info(f"Result summary:\n{result.head()}")
+    # Log the result (the dataframe is only rendered if the message is emitted)
+    logging.info("Result summary:\n%s", result.head())
 
     return result
 
@@ -451,30 +469,26 @@ def check_discrepancies(member_df, mentorship_df):
 
     logging.info("Starting the discrepancy check process...")
 
-    # Merge mentorship_df with member_df to get mentor and mentoree details
-    logging.info("Merging mentorship_df with member_df to get mentor and mentoree details...")
+    # Index the members by UUID once so both lookups reuse the same index
+    logging.info("Joining mentorship_df with member_df to get mentor and mentoree details...")
+    members_by_uuid = member_df.set_index('UUID')
     mentorship_merged = mentorship_df \
-        .merge(member_df[['UUID', 'gender', 'Age', 'registered_date']], left_on='Mentor_uuid', right_on='UUID', how='left') \
-        .rename(columns={'gender': 'Mentor_gender', 'Age': 'Mentor_Age', 'registered_date': 'Mentor_registered_date'}) \
-        .merge(member_df[['UUID', 'gender', 'Age']], left_on='Mentoree_uuid', right_on='UUID', how='left') \
-        .rename(columns={'gender': 'Mentoree_gender', 'Age': 'Mentoree_Age'})
+        .join(members_by_uuid[['gender', 'Age', 'registered_date', 'is_mentor_eligible']].add_prefix('Mentor_'),
+              on='Mentor_uuid') \
+        .join(members_by_uuid[['gender', 'Age', 'is_mentoree_eligible']].add_prefix('Mentoree_'),
+              on='Mentoree_uuid')
 
-    logging.info("Merging completed successfully.")
+    logging.info("Joining completed successfully.")
 
     # Find invalid mentors
     logging.info("Identifying invalid mentors...")
-    invalid_mentors = mentorship_merged[
-        ~((mentorship_merged['Mentor_gender'] == 'female') &
-          (mentorship_merged['Mentor_Age'] >= 40) &
-          (mentorship_merged['Mentor_registered_date'] <= pd.Timestamp("2004-01-01")))
-    ]
+    # Mentors that are missing from member_df have no eligibility flag and count as invalid
+    invalid_mentors = mentorship_merged[~mentorship_merged['Mentor_is_mentor_eligible'].eq(True)]
     logging.info(f"Found {len(invalid_mentors)} invalid mentors.")
 
     # Find invalid mentorees
     logging.info("Identifying invalid mentorees...")
-    invalid_mentorees = mentorship_merged[
-        ~(mentorship_merged['Mentoree_Age'] <= 30)
-    ]
+    invalid_mentorees = mentorship_merged[~mentorship_merged['Mentoree_is_mentoree_eligible'].eq(True)]
     logging.info(f"Found {len(invalid_mentorees)} invalid mentorees.")
 
     return invalid_mentors, invalid_mentorees
\ No newline at end of file
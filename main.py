@@ -17,21 +17,21 @@ def main():
         logging.info("Fetching users...")
         members = fetch_users()
 
-        # Step 2: Create Member Instances
-        logging.info("Creating member instances...")
-        member_data = create_members(members)
+        # Step 2: Create Members
+        logging.info("Creating members...")
+        member_df = create_members(members)
 
         # Step 3: Filter Mentors and mentorees
         logging.info("Filtering mentors and mentorees...")
-        mentors, mentorees = filter_mentors_and_mentorees(member_data)
+        mentors, mentorees = filter_mentors_and_mentorees(member_df)
 
         # Step 4: Assign Mentorships
         logging.info("Assigning mentorships...")
-        mentorships = assign_mentorships(mentors, mentorees)
+        mentorship_df = assign_mentorships(mentors, mentorees)
 
-        # Step 5: Normalize Data
-        logging.info("Normalizing data into dataframes...")
-        member_df, mentorship_df = normalize_data(member_data, mentorships)
+        # Step 5: Validate the dataframes
+        logging.info("Validating the dataframes...")
+        member_df, mentorship_df = normalize_data(member_df, mentorship_df)
 
         # Step 6: Calculate the median Age of Male Mentorees
         logging.info("Calculating median age of male mentorees...")
@@ -41,13 +41,13 @@ def main():
         # Step 7: Calculate the total Mentorees by Gender and Mentor Age
         logging.info("Calculating total mentorees by gender and mentor age...")
         gender_count = total_mentorees_by_gender_and_mentor_age(mentorship_df, member_df)
-        logging.info(f"Mentorees by Gender and Mentor Age: {gender_count}")
+        logging.info("Mentorees by Gender and Mentor Age: %s", gender_count)
 
         # Step 8: Check for Data Discrepancies across both dataframes
         logging.info("Checking for discrepancies in the data...")
         invalid_mentors, invalid_mentorees = check_discrepancies(member_df, mentorship_df)
-        logging.info(f"Invalid Mentors: {invalid_mentors}")
-        logging.info(f"Invalid Mentorees: {invalid_mentorees}")
+        logging.info("Invalid Mentors: %s", invalid_mentors)
+        logging.info("Invalid Mentorees: %s", invalid_mentorees)
 
     except Exception as e:
         logging.error(f"An error occurred: {e}")